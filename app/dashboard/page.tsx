@@ -34,33 +34,30 @@ function ChartFallback({ title, description }: { title: string; description?: st
 }
 
 export default async function DashboardPage() {
-  // Wrap data fetching in try/catch to handle errors
-  let dataProducts = []
-  let useCases = []
-  let sourceSystems = []
+  // Fetch independent sources concurrently, falling back to empty lists on error
+  const [dataProducts, useCases, sourceSystems] = await Promise.all([
+    getDataProducts().catch((error) => {
+      console.error("Failed to fetch data products:", error)
+      return []
+    }),
+    getUseCases().catch((error) => {
+      console.error("Failed to fetch use cases:", error)
+      return []
+    }),
+    getSourceSystems().catch((error) => {
+      console.error("Failed to fetch source systems:", error)
+      return []
+    }),
+  ])
 
-  try {
-    dataProducts = await getDataProducts()
-  } catch (error) {
-    console.error("Failed to fetch data products:", error)
-    dataProducts = []
+  // Tally certification and status counts in a single pass over the data products
+  const statusCounts: Record<string, number> = { Active: 0, "In Progress": 0, Draft: 0 }
+  let certifiedProducts = 0
+  for (const product of dataProducts) {
+    if (product.certified) certifiedProducts++
+    if (Object.hasOwn(statusCounts, product.status)) statusCounts[product.status]++
   }
 
-  try {
-    useCases = await getUseCases()
-  } catch (error) {
-    console.error("Failed to fetch use cases:", error)
-    useCases = []
-  }
-
-  try {
-    sourceSystems = await getSourceSystems()
-  } catch (error) {
-    console.error("Failed to fetch source systems:", error)
-    sourceSystems = []
-  }
-
-  const certifiedProducts = dataProducts.filter((p) => p.certified).length
   const certificationRate = dataProducts.length > 0 ? Math.round((certifiedProducts / dataProducts.length) * 100) : 0
 
   // Get the most recent data products for the progress display
@@ -70,9 +67,9 @@ export default async function DashboardPage() {
 
   // Prepare data for charts
   const statusChartData = [
-    { name: "Active", value: dataProducts.filter((p) => p.status === "Active").length },
-    { name: "In Progress", value: dataProducts.filter((p) => p.status === "In Progress").length },
-    { name: "Draft", value: dataProducts.filter((p) => p.status === "Draft").length },
+    { name: "Active", value: statusCounts["Active"] },
+    { name: "In Progress", value: statusCounts["In Progress"] },
+    { name: "Draft", value: statusCounts["Draft"] },
   ]
 
   const certificationChartData = [
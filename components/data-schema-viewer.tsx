@@ -49,11 +49,12 @@ export function DataSchemaViewer({ productId }: DataSchemaViewerProps) {
     }
   }
 
+  const normalizedSearch = searchTerm.toLowerCase()
   const filteredAttributes = attributes.filter(
     (attr) =>
-      attr.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      attr.display_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      (attr.description && attr.description.toLowerCase().includes(searchTerm.toLowerCase())),
+      attr.name.toLowerCase().includes(normalizedSearch) ||
+      attr.display_name.toLowerCase().includes(normalizedSearch) ||
+      (attr.description && attr.description.toLowerCase().includes(normalizedSearch)),
   )
 
   const categories = Array.from(new Set(filteredAttributes.map((attr) => attr.category || "Uncategorized")))
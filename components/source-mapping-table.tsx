@@ -39,10 +39,11 @@ export function SourceMappingTable({ productId }: SourceMappingTableProps) {
     fetchMappings()
   }, [productId])
 
+  const normalizedSearch = searchTerm.toLowerCase()
   const filteredMappings = mappings.filter((mapping) => {
     const matchesSearch =
-      mapping.source_attribute.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      (mapping.data_product_attributes?.display_name || "").toLowerCase().includes(searchTerm.toLowerCase())
+      mapping.source_attribute.toLowerCase().includes(normalizedSearch) ||
+      (mapping.data_product_attributes?.display_name || "").toLowerCase().includes(normalizedSearch)
 
     const matchesCategory =
       categoryFilter === "all" || (mapping.data_product_attributes?.category || "") === categoryFilter
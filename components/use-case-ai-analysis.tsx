@@ -24,19 +24,15 @@ export function UseCaseAIAnalysis({ useCaseText, onSave }: UseCaseAIAnalysisProp
     const analyzeUseCase = async () => {
       setIsLoading(true)
       try {
-        const productRecommendation = await generateAIResponse(
-          `Recommend a data product based on the following use case: ${useCaseText}`,
-        )
-        setDataProductRecommendation(productRecommendation || "No recommendation available.")
+        // The three recommendations are independent, so request them concurrently
+        const [productRecommendation, sourceRecommendation, certificationRec] = await Promise.all([
+          generateAIResponse(`Recommend a data product based on the following use case: ${useCaseText}`),
+          generateAIResponse(`Identify potential source systems for the following use case: ${useCaseText}`),
+          generateAIResponse(`Recommend certification steps for the following use case: ${useCaseText}`),
+        ])
 
-        const sourceRecommendation = await generateAIResponse(
-          `Identify potential source systems for the following use case: ${useCaseText}`,
-        )
+        setDataProductRecommendation(productRecommendation || "No recommendation available.")
         setSourceSystemRecommendation(sourceRecommendation || "No recommendation available.")
-
-        const certificationRec = await generateAIResponse(
-          `Recommend certification steps for the following use case: ${useCaseText}`,
-        )
         setCertificationRecommendation(certificationRec || "No recommendation available.")
       } catch (error) {
         toast({
@@ -15,6 +15,16 @@ When analyzing requirements, focus on:
 Provide specific, actionable recommendations based on best practices in data modeling.
 `
 
+// Create a single model instance shared across requests
+let modelInstance: ReturnType<typeof openai> | null = null
+
+const getModel = () => {
+  if (modelInstance) return modelInstance
+
+  modelInstance = openai("gpt-4o")
+  return modelInstance
+}
+
 export async function analyzeRequirements(requirements: string): Promise<string> {
   try {
     if (!process.env.OPEN_API_KEY) {
@@ -22,7 +32,7 @@ export async function analyzeRequirements(requirements: string): Promise<string>
     }
 
     const { text } = await generateText({
-      model: openai("gpt-4o"),
+      model: getModel(),
       prompt: requirements,
       system: SYSTEM_PROMPT,
     })
@@ -47,7 +57,7 @@ export async function generateDataSchema(requirements: string): Promise<any> {
     `
 
     const { text } = await generateText({
-      model: openai("gpt-4o"),
+      model: getModel(),
       prompt: schemaPrompt,
       system: SYSTEM_PROMPT,
     })
@@ -73,7 +83,7 @@ export async function identifySourceSystems(requirements: string): Promise<strin
     }
 
     const { text } = await generateText({
-      model: openai("gpt-4o"),
+      model: getModel(),
       prompt: `Identify potential source systems for this data product: "${requirements}"`,
       system: SYSTEM_PROMPT,
     })
@@ -96,51 +106,54 @@ function getFallbackResponse(type: "requirements" | "sources" | "schema"): strin
   }
 }
 
+// Static fallback schema, built once at module load
+const FALLBACK_SCHEMA = {
+  name: "Customer Profile",
+  description: "Core customer profile information for retail banking customers",
+  attributes: [
+    {
+      name: "customer_id",
+      displayName: "Customer ID",
+      description: "Unique identifier for the customer",
+      dataType: "string",
+      required: true,
+      pii: false,
+    },
+    {
+      name: "full_name",
+      displayName: "Full Name",
+      description: "Customer's full legal name",
+      dataType: "string",
+      required: true,
+      pii: true,
+    },
+    {
+      name: "email",
+      displayName: "Email Address",
+      description: "Primary email address for communications",
+      dataType: "string",
+      required: true,
+      pii: true,
+    },
+    {
+      name: "phone_number",
+      displayName: "Phone Number",
+      description: "Primary contact phone number",
+      dataType: "string",
+      required: false,
+      pii: true,
+    },
+    {
+      name: "address",
+      displayName: "Mailing Address",
+      description: "Physical mailing address",
+      dataType: "object",
+      required: false,
+      pii: true,
+    },
+  ],
+}
+
 function getFallbackSchema(): any {
-  return {
-    name: "Customer Profile",
-    description: "Core customer profile information for retail banking customers",
-    attributes: [
-      {
-        name: "customer_id",
-        displayName: "Customer ID",
-        description: "Unique identifier for the customer",
-        dataType: "string",
-        required: true,
-        pii: false,
-      },
-      {
-        name: "full_name",
-        displayName: "Full Name",
-        description: "Customer's full legal name",
-        dataType: "string",
-        required: true,
-        pii: true,
-      },
-      {
-        name: "email",
-        displayName: "Email Address",
-        description: "Primary email address for communications",
-        dataType: "string",
-        required: true,
-        pii: true,
-      },
-      {
-        name: "phone_number",
-        displayName: "Phone Number",
-        description: "Primary contact phone number",
-        dataType: "string",
-        required: false,
-        pii: true,
-      },
-      {
-        name: "address",
-        displayName: "Mailing Address",
-        description: "Physical mailing address",
-        dataType: "object",
-        required: false,
-        pii: true,
-      },
-    ],
-  }
+  return FALLBACK_SCHEMA
 }